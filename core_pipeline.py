@@ -17,6 +17,9 @@ from config import (
     PLAYER_RATE, FADE_OUT_DURATION, MAX_FINISH_DURATION
 )
 
+# 模块级绑定，Frame构造热路径上省去每次的属性查找
+_monotonic_ns = time.monotonic_ns
+
 class FrameType(Enum):
     """帧类型枚举"""
     DATA = auto()       # 普通数据帧
@@ -24,14 +27,29 @@ class FrameType(Enum):
     SYSTEM = auto()     # 系统帧(立即处理)
 
 class Frame:
-    """表示流水线中传递的数据帧"""
+    """表示流水线中传递的数据帧
+
+    音频路径上每个数据块都会创建一个Frame，使用__slots__省掉每实例的
+    __dict__，降低分配成本和内存占用。
+    """
+    __slots__ = ("type", "data", "metadata", "timestamp", "_id")
+
     def __init__(self, type: FrameType, data=None, metadata=None):
         self.type = type
         self.data = data or {}
         self.metadata = metadata or {}
-        self.timestamp = time.time()
-        self.id = str(uuid.uuid4())
-        
+        # 单调时钟整数时间戳(纳秒)：比time.time()更便宜且不受系统时间回拨影响
+        self.timestamp = _monotonic_ns()
+        # 帧ID属于冷元数据，延迟到首次访问时再生成，热路径不付uuid的开销
+        self._id = None
+
+    @property
+    def id(self):
+        """帧的唯一标识，首次访问时惰性生成"""
+        if self._id is None:
+            self._id = str(uuid.uuid4())
+        return self._id
+
     def __str__(self):
         return f"Frame[{self.type.name}]: {', '.join(self.data.keys())}"
 
@@ -337,6 +355,5 @@ def frames_to_wav_base64(frames, channels, sample_width, rate):
         wf.setframerate(rate)
         wf.writeframes(b''.join(frames))
     
-    wav_buffer.seek(0)
-    wav_bytes = wav_buffer.read()
-    return base64.b64encode(wav_bytes).decode('utf-8') 
\ No newline at end of file
+    # getbuffer()避免复制整个WAV负载；base64输出是纯ASCII，无需UTF-8校验
+    return base64.b64encode(wav_buffer.getbuffer()).decode('ascii') 
\ No newline at end of file
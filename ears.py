@@ -5,6 +5,7 @@ import os
 import numpy as np
 import onnxruntime
 import collections
+from concurrent.futures import ThreadPoolExecutor
 from config import (
     AUDIO_FORMAT, CHANNELS, RATE, CHUNK,
     MIN_SPEECH_DURATION
@@ -22,6 +23,9 @@ PRE_BUFFER_FRAMES = int(1.0 * RATE / CHUNK)  # 预缓冲帧数
 SPEECH_CONFIRM_FRAMES = 2  # 确认语音开始需要的连续帧数
 PRE_DETECTION_BUFFER_SIZE = int(2.0 * RATE / CHUNK)  # 预检测缓冲区大小
 
+# int16归一化到[-1,1)的缩放系数(float32标量，避免触发float64提升)
+_INT16_TO_FLOAT_SCALE = np.float32(1.0 / 32768.0)
+
 class Ears(ProcessorBase):
     """音频输入处理器 - 集成了语音检测和处理功能，直接将处理后的语音发送到AI处理器"""
     def __init__(self, name="audio_input"):
@@ -30,15 +34,38 @@ class Ears(ProcessorBase):
         self.stream = None
         self.vad_model = self._load_vad_model()
         
-        # VAD状态变量
+        # VAD递归状态：固定缓冲区，重置时就地清零
         self.state = np.zeros((2, 1, 128), dtype=np.float32)
         self.sr = RATE
-        
+
+        # 预分配的VAD推理输入输出缓冲区，每帧推理(32ms一次)零分配
+        self._vad_input = np.zeros((1, 512), dtype=np.float32)
+        self._sr_input = np.array(RATE, dtype=np.int64)
+        self._vad_prob = np.empty((1, 1), dtype=np.float32)
+        self._vad_state_next = np.empty((2, 1, 128), dtype=np.float32)
+
+        # IO binding：输入输出都预先绑定到上面的缓冲区，每次推理不再
+        # 解析输入字典、也不为输出分配新数组
+        self._vad_io = self.vad_model.io_binding()
+        self._vad_io.bind_cpu_input("input", self._vad_input)
+        self._vad_io.bind_cpu_input("state", self.state)
+        self._vad_io.bind_cpu_input("sr", self._sr_input)
+        self._vad_io.bind_ortvalue_output(
+            "output", onnxruntime.OrtValue.ortvalue_from_numpy(self._vad_prob))
+        self._vad_io.bind_ortvalue_output(
+            "stateN", onnxruntime.OrtValue.ortvalue_from_numpy(self._vad_state_next))
+
+        # 预热ONNX会话，把内核选择/内存池初始化的开销在启动时付掉
+        self._warmup_vad_model()
+
         # 保存音频文件设置
         self.save_audio_file = True  # 设置为True以保存音频文件
         
         # 循环缓冲区
         self.buffer = collections.deque(maxlen=PRE_DETECTION_BUFFER_SIZE)
+
+        # 预分配的帧临时缓冲区，避免每帧都保留PyAudio返回的bytes对象
+        self._frame_scratch = np.empty(CHUNK, dtype=np.int16)
         
         # 语音检测状态
         self.speech_detected = False
@@ -48,6 +75,9 @@ class Ears(ProcessorBase):
         self.speech_frames = []
         self.speech_start_time = None
         
+        # 语音结束后的编码/发送工作线程，避免阻塞VAD处理线程
+        self._post_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ears-post")
+
         # 同步锁和事件
         self.stream_lock = threading.RLock()
         self.speech_detected_event = threading.Event()
@@ -59,11 +89,31 @@ class Ears(ProcessorBase):
         """加载VAD模型"""
         model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models/silero_vad.onnx")
         print(f"加载Silero VAD ONNX模型: {model_path}")
-        return onnxruntime.InferenceSession(model_path)
+        # 单线程低延迟配置：(1,512)的小输入上，线程池fork/join的开销
+        # 超过并行计算的收益，单线程顺序执行反而更快且无抖动
+        so = onnxruntime.SessionOptions()
+        so.intra_op_num_threads = 1
+        so.inter_op_num_threads = 1
+        so.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        so.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        return onnxruntime.InferenceSession(
+            model_path, sess_options=so, providers=['CPUExecutionProvider'])
     
+    def _warmup_vad_model(self):
+        """用静音帧预热VAD模型，避免第一帧推理比稳态慢5~20倍导致语音起点漏检"""
+        try:
+            silent_frame = np.zeros(512, dtype=np.float32)
+            for _ in range(3):
+                self._detect_speech(silent_frame)
+            # 清除预热产生的状态
+            self.reset_vad_state()
+            print("[Ears] VAD模型预热完成")
+        except Exception as e:
+            print(f"[Ears] VAD模型预热失败: {e}")
+
     def reset_vad_state(self):
-        """重置VAD状态 - 现在不再需要保持状态"""
-        pass
+        """重置VAD状态 - 就地清零绑定到推理会话的状态缓冲区"""
+        self.state.fill(0.0)
     
     def start_mic_stream(self):
         """启动麦克风流"""
@@ -94,7 +144,7 @@ class Ears(ProcessorBase):
                 self.speech_ended_event.clear()
         
                 # 重置VAD状态
-                self.state = np.zeros((2, 1, 128), dtype=np.float32)
+                self.reset_vad_state()
                 
                 return True
             except Exception as e:
@@ -103,6 +153,9 @@ class Ears(ProcessorBase):
     
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """音频回调函数"""
+        # 输入溢出时只丢弃当前帧，不打印堆栈、不休眠，避免连带丢掉后续帧
+        if status and (status & pyaudio.paInputOverflow):
+            return (None, pyaudio.paContinue)
         if self.is_running:
             self.enqueue_frame(Frame(
                 FrameType.DATA, 
@@ -128,10 +181,21 @@ class Ears(ProcessorBase):
             # 添加到循环缓冲区
             self.buffer.append(audio_data)
                     
-            # 转换为numpy数组
+            # 转换为numpy数组：frombuffer是零拷贝视图，copyto单次memcpy进可写的
+            # 预分配缓冲区，之后立即释放对PyAudio字节对象的引用
             audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-            audio_float32 = int16_to_float32(audio_int16)
-            
+            if audio_int16.shape == self._frame_scratch.shape:
+                np.copyto(self._frame_scratch, audio_int16)
+                audio_int16 = self._frame_scratch
+
+            # int16→float32转换和1/32768缩放融合为一次向量化写入，
+            # 直接落到VAD输入缓冲区，省去中间float32临时数组
+            if audio_int16.size == 512:
+                np.multiply(audio_int16, _INT16_TO_FLOAT_SCALE, out=self._vad_input[0])
+                audio_float32 = self._vad_input[0]
+            else:
+                audio_float32 = int16_to_float32(audio_int16)
+
             # 检测语音
             is_speech = self._detect_speech(audio_float32)
             
@@ -190,47 +254,54 @@ class Ears(ProcessorBase):
         """结束语音收集并将音频发送到AI处理器"""
         if not self.is_collecting_speech:
             return
-            
+
         self.is_collecting_speech = False
         self.speech_detected = False
-        
-        # 收集的语音转为base64
-        if self.speech_frames:
-            # 处理完整的语音帧
-            try:
-                audio_base64 = self._convert_frames_to_base64(self.speech_frames)
-                print(f"[Ears] 语音转换为base64完成，长度: {len(audio_base64)}")
-                
-                # 如果启用了保存音频功能，则保存音频文件
-                if self.save_audio_file:
-                    self._save_audio_to_file(self.speech_frames, audio_base64)
-            
-                # 发送语音结束事件
-                self.speech_ended_event.set()
-                
-                # 直接发送到AI处理器 (使用DATA帧代替SYSTEM帧)
-                try:
-                    self.send_downstream(Frame(
-                        FrameType.DATA,
-                        {
-                            "type": "audio_data", 
-                            "audio_base64": audio_base64
-                        }
-                    ))
-                    print(f"[Ears] 语音数据已发送到AI处理器，帧数: {len(self.speech_frames)}")
-                except Exception as e:
-                    print(f"[Ears] 发送语音数据到AI处理器失败: {e}")
-                
-                speech_duration = time.time() - self.speech_start_time if self.speech_start_time else 0
-                print(f"[Ears] 语音结束，持续时间: {speech_duration:.2f}秒")
-            except Exception as e:
-                print(f"[Ears] 处理语音时出错: {e}")
-        
+
+        # 快照已收集的帧，编码和发送交给后台工作线程，
+        # 让VAD处理线程可以立即继续消费新的音频帧
+        frames = self.speech_frames
+        speech_start_time = self.speech_start_time
+
         # 重置状态
         self.consecutive_speech_frames = 0
         self.consecutive_silence_frames = 0
         self.speech_start_time = None
         self.speech_frames = []
+
+        if frames:
+            self._post_exec.submit(self._encode_and_send, frames, speech_start_time)
+
+    def _encode_and_send(self, frames, speech_start_time):
+        """在后台工作线程中完成WAV编码、base64转换并发送到AI处理器"""
+        try:
+            audio_base64 = self._convert_frames_to_base64(frames)
+            print(f"[Ears] 语音转换为base64完成，长度: {len(audio_base64)}")
+
+            # 如果启用了保存音频功能，则保存音频文件
+            if self.save_audio_file:
+                self._save_audio_to_file(frames, audio_base64)
+
+            # 发送语音结束事件
+            self.speech_ended_event.set()
+
+            # 直接发送到AI处理器 (使用DATA帧代替SYSTEM帧)
+            try:
+                self.send_downstream(Frame(
+                    FrameType.DATA,
+                    {
+                        "type": "audio_data",
+                        "audio_base64": audio_base64
+                    }
+                ))
+                print(f"[Ears] 语音数据已发送到AI处理器，帧数: {len(frames)}")
+            except Exception as e:
+                print(f"[Ears] 发送语音数据到AI处理器失败: {e}")
+
+            speech_duration = time.time() - speech_start_time if speech_start_time else 0
+            print(f"[Ears] 语音结束，持续时间: {speech_duration:.2f}秒")
+        except Exception as e:
+            print(f"[Ears] 处理语音时出错: {e}")
     
     def _convert_frames_to_base64(self, frames):
         """将音频帧转换为base64编码的WAV数据"""
@@ -257,40 +328,28 @@ class Ears(ProcessorBase):
             bool: 是否检测到语音
         """
         try:
-            # 确保输入形状正确 (Silero VAD 默认需要 512 采样点)
-            if len(audio_float32) != 512:
-                # 如果不是512点，进行补零或截断
-                if len(audio_float32) < 512:
-                    # 补零
-                    padded = np.zeros(512, dtype=np.float32)
-                    padded[:len(audio_float32)] = audio_float32
-                    audio_float32 = padded
-                else:
-                    # 取前512点
-                    audio_float32 = audio_float32[:512]
-            
-            # 重塑输入为模型期望的形状 [1, 512]
-            audio = np.array(audio_float32, dtype=np.float32).reshape(1, -1)
-            
-            # 准备ONNX输入
-            ort_inputs = {
-                "input": audio,
-                "state": self.state,  # 使用当前状态
-                "sr": np.array(self.sr, dtype=np.int64)  # 添加采样率
-            }
-            
-            # 运行ONNX推理
-            ort_outs = self.vad_model.run(None, ort_inputs)
-            
-            # 更新状态
-            if len(ort_outs) > 1:
-                self.state = ort_outs[1]
-            
-            # 获取语音概率 - 第一个输出是语音概率
-            speech_prob = ort_outs[0].item()  # 语音概率
-            
+            # 拷入预分配的[1, 512]输入缓冲区 (Silero VAD 默认需要 512 采样点)，
+            # 不足512点补零，超出截断，不再构造新数组
+            buf = self._vad_input[0]
+            n = len(audio_float32)
+            if n == 512:
+                # 调用方可能已直接写入了输入缓冲区(见process_frame的融合转换)
+                if audio_float32 is not buf:
+                    np.copyto(buf, audio_float32)
+            elif n < 512:
+                buf[:n] = audio_float32
+                buf[n:] = 0.0
+            else:
+                np.copyto(buf, audio_float32[:512])
+
+            # 通过预绑定的IO binding运行ONNX推理，结果直接写入预分配缓冲区
+            self.vad_model.run_with_iobinding(self._vad_io)
+
+            # 把新状态拷回绑定为输入的状态缓冲区(256个float，~1KB memcpy)
+            np.copyto(self.state, self._vad_state_next)
+
             # 使用阈值判断是否为语音
-            return speech_prob >= VAD_THRESHOLD
+            return self._vad_prob.item() >= VAD_THRESHOLD
             
         except Exception as e:
             print(f"[Ears] VAD检测出错: {e}")
@@ -345,6 +404,7 @@ class Ears(ProcessorBase):
     def close(self):
         """关闭资源"""
         self.stop_mic_stream()
+        self._post_exec.shutdown(wait=False)
         if self.p:
             self.p.terminate()
 
@@ -3,19 +3,113 @@ import numpy as np
 import pyaudio
 import threading
 import time
-import queue
-from config import PLAYER_RATE, FADE_OUT_DURATION, MAX_FINISH_DURATION
+from config import PLAYER_RATE, FADE_OUT_DURATION, MAX_FINISH_DURATION, DEBUG
 from core_pipeline import (
     ProcessorBase, Frame, FrameType
 )
 
+# 播放线程每次写入音频流的最大采样数
+PLAYBACK_BLOCK_SAMPLES = 2048
+
+def _build_fade_env(duration):
+    """生成时长为duration秒的Q15定点淡出包络(非线性曲线 1-p^2)"""
+    n = max(1, int(duration * PLAYER_RATE))
+    progress = np.linspace(0.0, 1.0, n, dtype=np.float32)
+    return ((1.0 - progress * progress) * 32767).astype(np.int16)
+
+# 常用淡出时长的包络在导入时预先生成，打断路径上不再临时构造
+_FADE_ENV_CACHE = {
+    FADE_OUT_DURATION: _build_fade_env(FADE_OUT_DURATION),
+    0.1: _build_fade_env(0.1),
+}
+
+class AudioRing:
+    """预分配的int16环形缓冲区 (单生产者/单消费者)
+
+    生产者(add_audio_data)把解码后的采样直接写入预分配的numpy缓冲区，
+    消费者(播放线程)按块读出，避免对每个音频块做bytes拼接和重复分配。
+    读写指针是单调递增的绝对样本计数，取模得到缓冲区内位置。
+    """
+    def __init__(self, capacity):
+        self._buf = np.empty(capacity, dtype=np.int16)
+        self._capacity = capacity
+        self._read = 0
+        self._write = 0
+        self._cond = threading.Condition()
+
+    def write(self, samples):
+        """写入int16采样，返回实际写入的样本数
+
+        容量不足时按FIFO策略丢弃最旧的未读数据为新数据腾出空间，
+        保证消费者停顿时内存有界，且恢复后播放的是最新的音频。
+        """
+        n = len(samples)
+        with self._cond:
+            if n >= self._capacity:
+                # 入块比整个缓冲区还大：只保留最新的capacity个采样
+                samples = samples[n - self._capacity:]
+                n = self._capacity
+                self._read = self._write
+            free = self._capacity - (self._write - self._read)
+            if n > free:
+                # FIFO修剪：推进读指针，丢弃最旧的采样
+                self._read += n - free
+            if n > 0:
+                pos = self._write % self._capacity
+                first = min(n, self._capacity - pos)
+                self._buf[pos:pos + first] = samples[:first]
+                if n > first:
+                    self._buf[0:n - first] = samples[first:n]
+                self._write += n
+            self._cond.notify()
+        return n
+
+    def read_into(self, out):
+        """读出采样填入预分配的out数组，返回实际读出的样本数"""
+        with self._cond:
+            avail = self._write - self._read
+            n = min(avail, len(out))
+            if n <= 0:
+                return 0
+            pos = self._read % self._capacity
+            first = min(n, self._capacity - pos)
+            out[:first] = self._buf[pos:pos + first]
+            if n > first:
+                out[first:n] = self._buf[0:n - first]
+            self._read += n
+            return n
+
+    def read(self, max_samples):
+        """读出最多max_samples个采样，返回int16数组(可能为空)"""
+        out = np.empty(max_samples, dtype=np.int16)
+        n = self.read_into(out)
+        return out[:n]
+
+    def available(self):
+        """当前可读样本数"""
+        return self._write - self._read
+
+    def wait_for_data(self, timeout):
+        """阻塞等待缓冲区有数据可读(或超时)，返回当前可读样本数"""
+        with self._cond:
+            if self._write == self._read:
+                self._cond.wait(timeout)
+            return self._write - self._read
+
+    def clear(self):
+        """丢弃所有未读数据并唤醒等待的消费者"""
+        with self._cond:
+            self._read = self._write
+            self._cond.notify()
+
 class Mouth(ProcessorBase):
     """音频输出处理器 - 负责播放音频数据"""
     def __init__(self, name="audio_output"):
         super().__init__(name)
         self.p = pyaudio.PyAudio()
         self.stream = None
-        self.audio_queue = queue.Queue()
+        # 预分配30秒容量的环形缓冲区，取代逐块分配的queue.Queue
+        self.audio_ring = AudioRing(PLAYER_RATE * 30)
         self.is_playing = False
         self.should_stop = False
         self.smooth_interrupt = False
@@ -26,28 +120,54 @@ class Mouth(ProcessorBase):
         self.fade_out_duration = FADE_OUT_DURATION
         self.fade_out_active = False
         self.fade_out_start_time = None
+        # 预计算的淡出增益包络(Q15定点int16)及采样游标
+        self._fade_env = None
+        self._fade_pos = 0
+        # 淡出乘法用的int32临时缓冲区，避免每块astype分配
+        self._fade_scratch_i32 = np.empty(PLAYBACK_BLOCK_SAMPLES, dtype=np.int32)
         self.max_finish_duration = MAX_FINISH_DURATION
         self.interrupt_time = None
         self.last_audio_time = None
         self.stream_lock = threading.RLock()
+        # 流代数计数器：写路径无锁快照流引用，代数变化即放弃旧流
+        self._stream_gen = 0
         self.playback_thread = None
         
         print("[Mouth] 初始化完成")
         
     def start_stream(self):
-        """启动音频输出流"""
+        """启动音频输出流
+
+        输出流打开一次后整个会话期间缓存复用：重新开始播放只需
+        restart已停止的流(~微秒级)，省去每句话10~50ms的设备打开成本。
+        """
         with self.stream_lock:
-            if self.stream is not None:
-                self.stop_stream()
-                
             try:
-                # 创建音频流
-                self.stream = self.p.open(
-                    format=pyaudio.paInt16,
-                    channels=1,
-                    rate=PLAYER_RATE,
-                    output=True
-                )
+                if self.stream is not None:
+                    # 复用缓存的流，必要时重新启动
+                    try:
+                        if self.stream.is_stopped():
+                            self.stream.start_stream()
+                    except Exception as e:
+                        # 复用失败则关闭重建
+                        print(f"[Mouth] 复用音频流失败，重新创建: {e}")
+                        try:
+                            self.stream.close()
+                        except Exception:
+                            pass
+                        self.stream = None
+
+                if self.stream is None:
+                    # 创建音频流
+                    self.stream = self.p.open(
+                        format=pyaudio.paInt16,
+                        channels=1,
+                        rate=PLAYER_RATE,
+                        output=True,
+                        # 显式指定缓冲帧数，与播放块大小对齐，每次write恰好两个周期
+                        frames_per_buffer=PLAYBACK_BLOCK_SAMPLES // 2
+                    )
+                self._stream_gen += 1
                 self.is_playing = True
                 self.should_stop = False
                 self.buffer_empty.set()
@@ -56,6 +176,8 @@ class Mouth(ProcessorBase):
                 self.interrupt_time = None
                 self.fade_out_active = False
                 self.fade_out_start_time = None
+                self._fade_env = None
+                self._fade_pos = 0
                 self.playback_finished.clear()
                 
                 # 启动播放线程
@@ -79,24 +201,20 @@ class Mouth(ProcessorBase):
             elif cmd == "pause":
                 self.smooth_interrupt = True
                 self.should_stop = True
-                self.interrupt_time = time.time()
+                self.interrupt_time = time.monotonic()
             elif cmd == "clear_pipeline":
                 print("[Mouth] 收到清空管道命令，立即停止播放并清空音频队列")
                 self.stop_immediately()
-                # 确保音频队列为空
-                while not self.audio_queue.empty():
-                    try:
-                        self.audio_queue.get_nowait()
-                        self.audio_queue.task_done()
-                    except queue.Empty:
-                        break
+                # 确保音频缓冲区为空
+                self.audio_ring.clear()
                 self.buffer_empty.set()
             
             # 处理开始播放事件
             event = frame.data.get("event")
             if event == "play_audio" and "audio_data" in frame.data:
                 self.add_audio_data(frame.data["audio_data"])
-                print(f"[Mouth] 收到音频数据，长度: {len(frame.data['audio_data'])} 字符")
+                if DEBUG:
+                    print(f"[Mouth] 收到音频数据，长度: {len(frame.data['audio_data'])}")
                 
         elif frame.type == FrameType.DATA:
             # 处理音频数据
@@ -109,7 +227,6 @@ class Mouth(ProcessorBase):
         if self.is_playing and (self.playback_thread is None or not self.playback_thread.is_alive()):
             print("[Mouth] 检测到播放线程已结束但状态未重置，强制重置状态")
             self.is_playing = False
-            self.stream = None
         
         # 如果未播放状态，则启动流
         if not self.is_playing:
@@ -129,167 +246,129 @@ class Mouth(ProcessorBase):
                     # 提取base64部分
                     if "base64," in audio_data:
                         audio_data = audio_data.split("base64,")[1]
-                    
-                    wav_bytes = base64.b64decode(audio_data)
-                    print(f"[Mouth] base64解码成功，长度: {len(wav_bytes)} 字节")
-                    # 直接转换为numpy数组，不进行任何处理
-                    audio_np = np.frombuffer(wav_bytes, dtype=np.int16)
-                    audio_data = audio_np.tobytes()
+
+                    audio_data = base64.b64decode(audio_data)
+                    if DEBUG:
+                        print(f"[Mouth] base64解码成功，长度: {len(audio_data)} 字节")
                 except Exception as e:
                     print(f"[Mouth] 解码base64音频失败: {e}")
                     return
-            
+
             # 平滑打断检查
             if self.smooth_interrupt and self.interrupt_time:
-                current_time = time.time()
+                current_time = time.monotonic()
                 if current_time - self.interrupt_time > self.max_finish_duration:
                     print("[Mouth] 平滑打断已达到最大时间，停止更多音频")
                     return
-            
-            # 添加到队列
-            self.audio_queue.put(audio_data)
+
+            # int16视图直接写入环形缓冲区(奇数字节尾部截断以对齐采样边界)
+            usable = len(audio_data) - (len(audio_data) % 2)
+            if usable <= 0:
+                return
+            samples = np.frombuffer(audio_data, dtype=np.int16, count=usable // 2)
+            written = self.audio_ring.write(samples)
             self.buffer_empty.clear()
-            self.last_audio_time = time.time()
-            print(f"[Mouth] 音频数据已添加到队列，当前队列大小: {self.audio_queue.qsize()}")
+            self.last_audio_time = time.monotonic()
+            if DEBUG:
+                print(f"[Mouth] 音频数据已写入缓冲区，本次{written}个采样，当前可读: {self.audio_ring.available()}")
         except Exception as e:
             print(f"[Mouth] 音频处理错误: {e}")
             
     def _play_audio_continuous(self):
         """后台持续音频播放线程"""
         print("[Mouth] 播放线程已启动")
-        buffer = b""
-        min_buffer_size = 1024  # 减小缓冲区以提高响应速度
-        is_initial_buffer = True
-        last_check_time = time.time()
-        check_interval = 0.005  # 每5毫秒检查一次终止请求
+        # 消费者线程私有的预分配块缓冲区，稳态播放零分配
+        scratch = np.empty(PLAYBACK_BLOCK_SAMPLES, dtype=np.int16)
         chunks_played = 0
-        
+
+        # 循环不变量提为局部变量，减少热循环中的重复属性查找
+        ring = self.audio_ring
+        max_finish_duration = self.max_finish_duration
+
         try:
             while self.is_playing and (not self.should_stop or self.smooth_interrupt):
-                current_time = time.time()
-                
+                current_time = time.monotonic()
+
+                # 本次迭代的状态快照(写入方只会翻转一次，下一迭代即可见)
+                should_stop = self.should_stop
+                smooth_interrupt = self.smooth_interrupt
+                interrupt_time = self.interrupt_time
+
                 # 立即检查是否有直接停止请求
-                if self.should_stop and not self.smooth_interrupt:
+                if should_stop and not smooth_interrupt:
                     print("[Mouth] 检测到直接停止请求，立即终止播放")
                     break
-                
+
                 # 处理淡出效果
-                if self.smooth_interrupt and self.interrupt_time and self.fade_out_enabled and not self.fade_out_active:
+                if smooth_interrupt and interrupt_time and self.fade_out_enabled and not self.fade_out_active:
                     self.fade_out_active = True
                     self.fade_out_start_time = current_time
+                    self._begin_fade_out()
                     print("[Mouth] 开始音量淡出效果...")
-                
+
                 # 检查是否已经到达最大完成时间
-                if self.smooth_interrupt and self.interrupt_time:
-                    elapsed = current_time - self.interrupt_time
-                    if elapsed > self.max_finish_duration * 0.8:  # 降低到80%的最大等待时间
+                if smooth_interrupt and interrupt_time:
+                    elapsed = current_time - interrupt_time
+                    if elapsed > max_finish_duration * 0.8:  # 降低到80%的最大等待时间
                         print("[Mouth] 达到最大等待时间的80%，强制停止音频")
                         break
-                
-                try:
-                    # 处理队列中的音频数据
-                    chunks_processed = 0
-                    while not self.audio_queue.empty():
-                        # 每处理几个数据块就检查一次终止请求
-                        chunks_processed += 1
-                        if chunks_processed % 5 == 0 and self.should_stop and not self.smooth_interrupt:
-                            print("[Mouth] 数据处理中检测到停止请求，立即终止")
+
+                # 从环形缓冲区读出一个播放块到预分配的scratch
+                n_samples = ring.read_into(scratch)
+                audio_np = scratch[:n_samples]
+
+                if n_samples > 0:
+                    # 对当前块应用淡出效果（如果需要）
+                    if self.fade_out_active and self._fade_env is not None:
+                        audio_np, fade_progress = self._apply_fade_out(audio_np)
+
+                        # 如果淡出接近完成，结束播放
+                        if fade_progress >= 0.6:  # 降低阈值，当达到60%时就结束
+                            print(f"[Mouth] 淡出已达到阈值 {fade_progress:.2f}，结束播放")
                             break
-                            
-                        chunk = self.audio_queue.get(block=False)
-                        buffer += chunk
-                        self.audio_queue.task_done()
-                    
-                    # 再次检查终止请求
+
+                    # 检查是否应当强制停止(如果打断且超过了最大时间)
+                    if smooth_interrupt and interrupt_time:
+                        elapsed = current_time - interrupt_time
+                        if elapsed > max_finish_duration * 0.4:  # 进一步减小等待时间到40%
+                            print("[Mouth] 打断等待时间过长，强制停止")
+                            break
+
+                    # 播放前重新读取最新标志，停止请求不受本迭代快照影响
                     if self.should_stop and not self.smooth_interrupt:
-                        print("[Mouth] 数据处理后检测到停止请求，立即终止")
+                        print("[Mouth] 播放前检测到停止请求，立即终止")
                         break
-                    
-                    # 当缓冲区有足够数据，或者是最后的数据时播放
-                    if len(buffer) >= min_buffer_size or (len(buffer) > 0 and self.audio_queue.empty()):
-                        if is_initial_buffer:
-                            print("[Mouth] 初始缓冲完成，开始平滑播放...")
-                            is_initial_buffer = False
-                        
-                        # 对当前块应用淡出效果（如果需要）
-                        if self.fade_out_active and self.fade_out_start_time:
-                            fade_progress = min(1.0, (current_time - self.fade_out_start_time) / self.fade_out_duration)
-                            audio_data = np.frombuffer(buffer, dtype=np.int16)
-                            
-                            # 使用非线性淡出曲线，在开始时变化较慢，结束时变化较快
-                            volume_factor = max(0, 1.0 - (fade_progress * fade_progress))
-                            
-                            # 应用音量变化
-                            audio_data = (audio_data * volume_factor).astype(np.int16)
-                            buffer = audio_data.tobytes()
-                            
-                            # 如果淡出接近完成，结束播放
-                            if fade_progress >= 0.6:  # 降低阈值，当达到60%时就结束
-                                print(f"[Mouth] 淡出已达到阈值 {fade_progress:.2f}，结束播放")
-                                break
-                        
-                        # 检查是否应当强制停止(如果打断且超过了最大时间)
-                        if self.smooth_interrupt and self.interrupt_time:
-                            elapsed = current_time - self.interrupt_time
-                            if elapsed > self.max_finish_duration * 0.4:  # 进一步减小等待时间到40%
-                                print("[Mouth] 打断等待时间过长，强制停止")
-                                break
-                        
-                        # 播放前再次检查终止请求
-                        if self.should_stop and not self.smooth_interrupt:
-                            print("[Mouth] 播放前检测到停止请求，立即终止")
-                            break
-                        
-                        # 播放音频数据
-                        with self.stream_lock:
-                            if self.stream and (not self.should_stop or self.smooth_interrupt):
-                                try:
-                                    # 将大块数据分成小块播放，每块之间检查终止请求
-                                    if len(buffer) > 2048 and not self.smooth_interrupt:
-                                        chunks = [buffer[i:i+2048] for i in range(0, len(buffer), 2048)]
-                                        for i, small_chunk in enumerate(chunks):
-                                            # 每播放一小块就检查终止请求
-                                            if i > 0 and self.should_stop and not self.smooth_interrupt:
-                                                print(f"[Mouth] 分块播放中检测到停止请求，已播放{i}/{len(chunks)}块，立即终止")
-                                                break
-                                            self.stream.write(small_chunk, exception_on_underflow=False)
-                                            chunks_played += 1
-                                    else:
-                                        self.stream.write(buffer, exception_on_underflow=False)
-                                        chunks_played += 1
-                                    print(f"[Mouth] 已播放音频数据，总计 {chunks_played} 个块")
-                                except Exception as e:
-                                    print(f"[Mouth] 音频播放过程中出错: {e}")
-                                    break
-                        buffer = b""
-                    
-                    # 检查是否应当结束播放
-                    if self.audio_queue.empty() and len(buffer) == 0:
-                        if self.smooth_interrupt:
-                            print("[Mouth] 平滑打断：当前音频已完成")
+
+                    # 播放音频数据：无锁快照流引用和代数，关闭方通过提升代数
+                    # 让写路径在下一次迭代放弃旧流，写入本身不持有任何锁
+                    stream = self.stream
+                    gen = self._stream_gen
+                    if stream is not None and gen == self._stream_gen and (not self.should_stop or self.smooth_interrupt):
+                        try:
+                            stream.write(audio_np.tobytes(), exception_on_underflow=False)
+                            chunks_played += 1
+                        except OSError as e:
+                            # PortAudio设备错误(欠载/设备拔出等)
+                            print(f"[Mouth] 音频播放过程中出错: {e}")
                             break
-                        
-                        # 检查两次音频之间的等待时间
-                        if self.last_audio_time:
-                            wait_time = current_time - self.last_audio_time
-                            if wait_time > 1.0:  # 如果超过1秒没有新音频，结束播放
-                                print(f"[Mouth] 等待音频数据超时，播放完成")
-                                break
-                    
-                    # 如果队列为空，短暂暂停以避免CPU占用过高
-                    if self.audio_queue.empty() and not self.should_stop:
-                        # 用更短的时间轮询，提高响应性
-                        time.sleep(0.01)
-                    
-                    # 定期检查是否需要退出
-                    if current_time - last_check_time >= check_interval:
-                        last_check_time = current_time
-                        if self.should_stop and not self.smooth_interrupt:
+                else:
+                    # 缓冲区已空，检查是否应当结束播放
+                    if smooth_interrupt:
+                        print("[Mouth] 平滑打断：当前音频已完成")
+                        break
+
+                    # 检查两次音频之间的等待时间
+                    if self.last_audio_time:
+                        wait_time = current_time - self.last_audio_time
+                        if wait_time > 1.0:  # 如果超过1秒没有新音频，结束播放
+                            print(f"[Mouth] 等待音频数据超时，播放完成")
                             break
-                    
-                except Exception as e:
-                    print(f"[Mouth] 音频处理循环出错: {e}")
-                    break
+
+                    # 在条件变量上等待新数据，生产者写入时立即被唤醒，
+                    # 空闲时不再以10ms的固定周期空转
+                    if not self.should_stop:
+                        ring.wait_for_data(0.1)
+
         except Exception as e:
             print(f"[Mouth] 播放线程异常: {e}")
         finally:
@@ -299,25 +378,58 @@ class Mouth(ProcessorBase):
             self.playback_finished.set()
             self.buffer_empty.set()
             
-            # 关闭音频流
+            # 停止音频流但保持打开状态，供下一次播放复用
+            self._stream_gen += 1
             with self.stream_lock:
                 if self.stream:
                     try:
-                        self.stream.stop_stream()
-                        self.stream.close()
+                        if self.stream.is_active():
+                            self.stream.stop_stream()
                     except Exception as e:
-                        print(f"[Mouth] 关闭音频流时出错: {e}")
-                    finally:
-                        self.stream = None
-            
+                        print(f"[Mouth] 停止音频流时出错: {e}")
+
             print(f"[Mouth] 播放线程结束，共播放了 {chunks_played} 个音频块")
             
             # 显式重置播放状态变量，确保下次能重新启动
             self.playback_thread = None
     
+    def _begin_fade_out(self):
+        """取出当前fade_out_duration对应的淡出增益包络
+
+        常用时长直接命中模块级缓存；首次出现的时长构建一次后缓存，
+        打断路径(对用户延迟敏感)上不再重复做linspace+astype分配。
+        """
+        env = _FADE_ENV_CACHE.get(self.fade_out_duration)
+        if env is None:
+            env = _build_fade_env(self.fade_out_duration)
+            _FADE_ENV_CACHE[self.fade_out_duration] = env
+        self._fade_env = env
+        self._fade_pos = 0
+
+    def _apply_fade_out(self, audio_np):
+        """对一个播放块就地应用淡出增益，返回(处理后的块, 淡出进度0~1+)
+
+        全程int16/int32整数运算：扩展进预分配的int32缓冲区、乘增益、
+        右移15位再回写，不再产生float64临时数组或新的int16数组。
+        """
+        env = self._fade_env
+        n = len(audio_np)
+        take = min(n, len(env) - self._fade_pos)
+        scaled = self._fade_scratch_i32[:n]
+        np.copyto(scaled, audio_np)
+        if take > 0:
+            scaled[:take] *= env[self._fade_pos:self._fade_pos + take]
+            scaled[:take] >>= 15
+        if take < n:
+            # 包络已走完，剩余部分静音
+            scaled[take:] = 0
+        np.copyto(audio_np, scaled)
+        self._fade_pos += n
+        return audio_np, self._fade_pos / len(env)
+
     def is_audio_complete(self):
         """检查音频播放是否已完成"""
-        return self.buffer_empty.is_set() and self.audio_queue.empty()
+        return self.buffer_empty.is_set() and self.audio_ring.available() == 0
     
     def request_smooth_interrupt(self):
         """请求平滑打断播放"""
@@ -326,7 +438,7 @@ class Mouth(ProcessorBase):
         
         self.smooth_interrupt = True
         self.should_stop = True
-        self.interrupt_time = time.time()
+        self.interrupt_time = time.monotonic()
         print("[Mouth] 已请求平滑打断播放")
         
         if self.playback_thread and self.playback_thread.is_alive():
@@ -343,50 +455,42 @@ class Mouth(ProcessorBase):
             return self.stop_immediately()
     
     def stop_stream(self):
-        """关闭音频流但不中断当前播放"""
+        """停止播放；音频流保持打开状态以便下次复用"""
+        print("[Mouth] 开始停止音频流...")
+        self.should_stop = True
+        # 提升流代数，写路径在下一次迭代放弃当前流
+        self._stream_gen += 1
+
+        # 清空缓冲区
+        self.audio_ring.clear()
+
+        # 设置事件
+        self.buffer_empty.set()
+        self.playback_finished.set()
+
+        # 等待播放线程自行退出并停止流 (加入超时防止死锁)
+        thread = self.playback_thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            print("[Mouth] 等待播放线程结束...")
+            thread.join(timeout=1.0)
+
+        # 线程未能在超时内停止流时，在这里兜底停止
         with self.stream_lock:
-            self.should_stop = True
-            
             if self.stream:
                 try:
-                    print("[Mouth] 开始关闭音频流...")
-                    
-                    # 清空队列
-                    while not self.audio_queue.empty():
-                        try:
-                            self.audio_queue.get_nowait()
-                            self.audio_queue.task_done()
-                        except queue.Empty:
-                            break
-                    
-                    # 关闭流
-                    self.stream.stop_stream()
-                    self.stream.close()
-                    self.stream = None
-        
-                    # 设置事件
-                    self.buffer_empty.set()
-                    self.playback_finished.set()
-                    
-                    # 等待播放线程结束 (加入超时防止死锁)
-                    if self.playback_thread and self.playback_thread.is_alive():
-                        print("[Mouth] 等待播放线程结束...")
-                        self.playback_thread.join(timeout=1.0)
-                    
-                    # 无论线程是否结束，都强制重置状态
-                    self.is_playing = False
-                    self.smooth_interrupt = False
-                    self.fade_out_active = False
-                    self.playback_thread = None
-                    
-                    print("[Mouth] 音频流已完全关闭")
-                    return True
+                    if self.stream.is_active():
+                        self.stream.stop_stream()
                 except Exception as e:
-                    print(f"[Mouth] 关闭音频流时出错: {e}")
-                    # 出错时也重置关键状态
-                    self.is_playing = False
-                    self.playback_thread = None
-                    return False
+                    print(f"[Mouth] 停止音频流时出错: {e}")
+
+        # 无论线程是否结束，都强制重置状态
+        self.is_playing = False
+        self.smooth_interrupt = False
+        self.fade_out_active = False
+        self.playback_thread = None
+
+        print("[Mouth] 播放已停止，音频流保持缓存")
+        return True
     
     def stop_immediately(self):
         """立即停止所有播放"""
@@ -396,17 +500,9 @@ class Mouth(ProcessorBase):
         self.should_stop = True
         self.smooth_interrupt = False
         
-        # 清空队列
-        try:
-            while not self.audio_queue.empty():
-                try:
-                    self.audio_queue.get_nowait()
-                    self.audio_queue.task_done()
-                except queue.Empty:
-                    break
-        except:
-            pass
-            
+        # 清空缓冲区
+        self.audio_ring.clear()
+
         # 停止流
         success = self.stop_stream()
         return success
@@ -414,8 +510,19 @@ class Mouth(ProcessorBase):
     def close(self):
         """关闭并清理资源"""
         self.stop_immediately()
+
+        # 真正关闭缓存的音频流
+        with self.stream_lock:
+            if self.stream:
+                try:
+                    self.stream.close()
+                except Exception as e:
+                    print(f"[Mouth] 关闭音频流时出错: {e}")
+                finally:
+                    self.stream = None
+
         if self.p:
             try:
                 self.p.terminate()
             except Exception as e:
-                print(f"[Mouth] 终止PyAudio时出错: {e}") 
\ No newline at end of file
+                print(f"[Mouth] 终止PyAudio时出错: {e}")
\ No newline at end of file
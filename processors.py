@@ -279,24 +279,27 @@ class AIProcessor(ProcessorBase):
                             if not self.is_generating or (self.context and self.context.is_cancelled()):
                                 break
                             
-                            # 解码音频数据
+                            # 解码音频数据：base64只在API边界解码一次，
+                            # 管道内部传递原始PCM字节，下游不再重复解码
                             audio_data = delta.audio["data"]
                             print(f"[AIProcessor] 收到音频数据 (chunk {chunk_count}), 长度: {len(audio_data)} 字符")
-                            
+
+                            try:
+                                audio_bytes = base64.b64decode(audio_data)
+                            except Exception as e:
+                                print(f"[AIProcessor] 解码音频数据失败: {e}")
+                                continue
+
                             # 收集音频数据用于调试
                             if DEBUG and ai_audio_buffer is not None:
-                                try:
-                                    audio_bytes = base64.b64decode(audio_data)
-                                    ai_audio_buffer.extend(audio_bytes)
-                                    print(f"[AIProcessor] 已收集音频数据: {len(ai_audio_buffer)} 字节")
-                                except Exception as e:
-                                    print(f"[AIProcessor] 收集音频数据时出错: {e}")
-                            
+                                ai_audio_buffer.extend(audio_bytes)
+                                print(f"[AIProcessor] 已收集音频数据: {len(ai_audio_buffer)} 字节")
+
                             # 发送音频数据到输出处理器
                             try:
                                 self.send_downstream(Frame(
                                     FrameType.SYSTEM,
-                                    {"event": "play_audio", "audio_data": audio_data}
+                                    {"event": "play_audio", "audio_data": audio_bytes}
                                 ))
                                 print("[AIProcessor] 音频数据已成功发送到输出处理器")
                             except Exception as e:
@@ -1,5 +1,21 @@
 import platform
 
+# 按类缓存"是否为Rectangle类对象"的判断结果，
+# 避免每次__eq__比较都执行str(other.__class__)的字符串构造和子串查找
+_blocked_comparand_classes = {}
+
+def is_blocked_comparand(other):
+    """判断other是否属于不应参与相等比较的类型(如System.Drawing.Rectangle)"""
+    cls = other.__class__ if hasattr(other, '__class__') else None
+    if cls is None:
+        return False
+    cached = _blocked_comparand_classes.get(cls)
+    if cached is None:
+        class_name = str(cls)
+        cached = 'Rectangle' in class_name or 'System.Drawing' in class_name
+        _blocked_comparand_classes[cls] = cached
+    return cached
+
 
 def apply_windows_compatibility_patches():
     """为Windows平台应用兼容性补丁，解决对象类型比较问题"""
@@ -38,12 +54,10 @@ def patch_class_eq(cls):
         return  # 已经打过补丁了
     
     original_eq = cls.__eq__ if hasattr(cls, '__eq__') else None
-    
+
     def safe_eq(self, other):
-        if hasattr(other, '__class__'):
-            class_name = str(other.__class__)
-            if 'Rectangle' in class_name or 'System.Drawing' in class_name:
-                return False
+        if is_blocked_comparand(other):
+            return False
         if original_eq and original_eq is not object.__eq__:
             return original_eq(self, other)
         return self is other
@@ -60,10 +74,8 @@ def monkey_patch_threading_event():
     
     # 定义新的__eq__方法
     def safe_eq(self, other):
-        if hasattr(other, '__class__'):
-            class_name = str(other.__class__)
-            if 'Rectangle' in class_name or 'System.Drawing' in class_name:
-                return False
+        if is_blocked_comparand(other):
+            return False
         return original_eq(self, other)
     
     # 应用补丁
@@ -10,6 +10,15 @@ from Agent import Agent
 from mouth import Mouth
 from ears import Ears
 
+# JSON序列化：优先使用orjson(C实现，SIMD加速)，未安装时回退到标准库json
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('ascii')
+except ImportError:
+    _dumps = json.dumps
+
 # 创建一个Window包装类，用于安全地访问window对象
 class WindowWrapper:
     def __init__(self, window=None):
@@ -220,7 +229,7 @@ class AgentAPI:
                 
                 # 发送数据到前端
                 if volume_data:
-                    volume_json = json.dumps(volume_data)
+                    volume_json = _dumps(volume_data)
                     self.window_wrapper.evaluate_js(f'window.updateVolumeData({volume_json})')
                 
                 time.sleep(update_interval)